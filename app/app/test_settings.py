@@ -0,0 +1,31 @@
+"""
+Django settings used when running the test suite.
+"""
+import logging
+import os
+
+from .settings import *  # noqa: F401,F403
+
+DEBUG = False
+
+# The models only use portable field types, so TEST_DB=sqlite runs the
+# tests against an in-memory SQLite database for a quick local loop.
+# CI leaves it unset and tests against PostgreSQL like production.
+if os.environ.get('TEST_DB') == 'sqlite':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': ':memory:',
+        }
+    }
+
+# Password hashing dominates user creation in tests; MD5 is insecure but
+# fast, which is all the test users need.
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+# Skip Django's logging setup and drop every record, so 4xx responses
+# exercised by the tests are not formatted and written out.
+LOGGING_CONFIG = None
+logging.disable(logging.CRITICAL)
@@ -1,26 +1,57 @@
 """
-Django command to wait for the databae to be acailable
+Django command to wait for the database to be available
 """
 
+import socket
 import time
+from django.conf import settings
 from django.core.management.base import BaseCommand
-from psycopg2 import OperationalError as Pyscopg2OpError
+from psycopg2 import OperationalError as Psycopg2OpError
 from django.db.utils import OperationalError
 
+# Retry delays (in seconds) grow exponentially from INITIAL_DELAY up to
+# MAX_DELAY.
+INITIAL_DELAY = 0.1
+MAX_DELAY = 2.0
+# A TCP connect to the database port is much cheaper than a full
+# authenticated check, so it is tried first on every attempt.
+PROBE_TIMEOUT = 0.2
+DEFAULT_PORT = 5432
+
 
 class Command(BaseCommand):
     """Django command to wait for database."""
 
     def handle(self, *args, **options):
-        """Enterypoint for commands"""
+        """Entrypoint for command"""
         self.stdout.write('Waiting for database...')
         db_up = False
+        delay = INITIAL_DELAY
         while db_up is False:
-            try:
-                self.check(databases=["default"])
-                db_up = True
-            except (Pyscopg2OpError, OperationalError):
-                self.stdout.write("Database unavailable, waiting 1 sec...")
-                time.sleep(1)
+            if self._db_port_open():
+                try:
+                    self.check(databases=["default"])
+                    db_up = True
+                except (Psycopg2OpError, OperationalError):
+                    pass
+            if db_up is False:
+                self.stdout.write(
+                    f"Database unavailable, waiting {delay:g} sec...")
+                time.sleep(delay)
+                delay = min(delay * 2, MAX_DELAY)
 
         self.stdout.write(self.style.SUCCESS("Database available!"))
+
+    def _db_port_open(self):
+        """Return whether the database port accepts TCP connections"""
+        db = settings.DATABASES['default']
+        host = db.get('HOST')
+        if not host or host.startswith('/'):
+            # Local unix socket, nothing to probe
+            return True
+        port = int(db.get('PORT') or DEFAULT_PORT)
+        try:
+            socket.create_connection((host, port), PROBE_TIMEOUT).close()
+        except OSError:
+            return False
+        return True
@@ -67,6 +67,27 @@ class Recipe(models.Model):
         return self.title
 
 
+class TagManager(models.Manager):
+    """Manager for tags"""
+
+    def get_or_create_many(self, user, names):
+        """return the user's tags for names, creating the missing ones"""
+        names = list(dict.fromkeys(names))
+        tags = {
+            tag.name: tag for tag in self.filter(user=user, name__in=names)
+        }
+        missing = [name for name in names if name not in tags]
+        if missing:
+            created = self.bulk_create(
+                [self.model(user=user, name=name) for name in missing])
+            # only some backends (e.g. PostgreSQL) set pks on bulk_create
+            if any(tag.pk is None for tag in created):
+                created = self.filter(user=user, name__in=missing)
+            tags.update((tag.name, tag) for tag in created)
+
+        return [tags[name] for name in names]
+
+
 class Tag(models.Model):
     """Tag for filtering recipes"""
     name = models.CharField(max_length=255)
@@ -75,6 +96,8 @@ class Tag(models.Model):
         on_delete=models.CASCADE
     )
 
+    objects = TagManager()
+
     def __str__(self):
         return self.name
 
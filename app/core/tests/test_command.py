@@ -2,18 +2,20 @@
 Test custom django management commands.
 """
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from psycopg2 import OperationalError as Psycopg2Error
+from django.conf import settings
 from django.core.management import call_command
 from django.db.utils import OperationalError
 from django.test import SimpleTestCase
 
 
+@patch('core.management.commands.wait_for_db.socket.create_connection')
 @patch('core.management.commands.wait_for_db.Command.check')
 class CommandTests(SimpleTestCase):
     """Test commands"""
 
-    def test_wait_for_db_ready(self, patched_check):
+    def test_wait_for_db_ready(self, patched_check, patched_connect):
         """Test waitting for database if database ready"""
         patched_check.return_value = True
 
@@ -22,7 +24,8 @@ class CommandTests(SimpleTestCase):
         patched_check.assert_called_once_with(databases=['default'])
 
     @patch('time.sleep')
-    def test_wait_for_db_delay(self, patched_sleep, patched_check):
+    def test_wait_for_db_delay(
+            self, patched_sleep, patched_check, patched_connect):
         """Test waiting for db when getting operational error"""
         patched_check.side_effect = [Psycopg2Error] * 2 + \
             [OperationalError] * 3 + [True]
@@ -31,3 +34,29 @@ class CommandTests(SimpleTestCase):
 
         self.assertEqual(patched_check.call_count, 6)
         patched_check.assert_called_with(databases=["default"])
+
+    @patch('time.sleep')
+    def test_wait_for_db_backoff(
+            self, patched_sleep, patched_check, patched_connect):
+        """Test retry delay doubles on each failure up to the cap"""
+        patched_check.side_effect = [OperationalError] * 7 + [True]
+
+        call_command("wait_for_db")
+
+        self.assertEqual(
+            [c.args[0] for c in patched_sleep.call_args_list],
+            [0.1, 0.2, 0.4, 0.8, 1.6, 2.0, 2.0],
+        )
+
+    @patch.dict(settings.DATABASES['default'], {'HOST': 'db', 'PORT': ''})
+    @patch('time.sleep')
+    def test_wait_for_db_port_closed(
+            self, patched_sleep, patched_check, patched_connect):
+        """Test full check is skipped until the database port is open"""
+        patched_connect.side_effect = [OSError] * 2 + [MagicMock()]
+
+        call_command("wait_for_db")
+
+        self.assertEqual(patched_sleep.call_count, 2)
+        patched_connect.assert_called_with(('db', 5432), 0.2)
+        patched_check.assert_called_once_with(databases=["default"])
@@ -77,6 +77,19 @@ class ModelTests(TestCase):
 
         self.assertEqual(str(tag), tag.name)
 
+    def test_get_or_create_many_tags(self):
+        """Test existing tags are reused and missing ones created once"""
+        user = create_user()
+        existing = models.Tag.objects.create(user=user, name='Lunch')
+
+        tags = models.Tag.objects.get_or_create_many(
+            user, ['Lunch', 'Thai', 'Thai'])
+
+        self.assertEqual([tag.name for tag in tags], ['Lunch', 'Thai'])
+        self.assertEqual(tags[0], existing)
+        self.assertIsNotNone(tags[1].pk)
+        self.assertEqual(models.Tag.objects.filter(user=user).count(), 2)
+
     def test_create_ingredient(self):
         """Test creating an ingredient is successful"""
         user = create_user()
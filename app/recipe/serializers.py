@@ -1,10 +1,31 @@
 """Recipe serilizer"""
+from django.utils.functional import cached_property
 from rest_framework import serializers
 
 from core.models import Recipe, Tag, Ingredient
 
 
-class IngredientSerializer(serializers.ModelSerializer):
+class CachedFieldsModelSerializer(serializers.ModelSerializer):
+    """ModelSerializer that filters its readable/writable fields once
+
+    DRF rebuilds these from self.fields for every object it handles, so a
+    many=True serializer repeats the work for each row.
+    """
+
+    @cached_property
+    def _readable_fields(self):
+        return tuple(
+            field for field in self.fields.values() if not field.write_only
+        )
+
+    @cached_property
+    def _writable_fields(self):
+        return tuple(
+            field for field in self.fields.values() if not field.read_only
+        )
+
+
+class IngredientSerializer(CachedFieldsModelSerializer):
     """Serializer for ingredients"""
     class Meta:
         model = Ingredient
@@ -12,7 +33,7 @@ class IngredientSerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
 
 
-class TagSerializer(serializers.ModelSerializer):
+class TagSerializer(CachedFieldsModelSerializer):
     """Serializer for tags"""
     class Meta:
         model = Tag
@@ -20,7 +41,7 @@ class TagSerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
 
 
-class RecipeSerializer(serializers.ModelSerializer):
+class RecipeSerializer(CachedFieldsModelSerializer):
     """serializer for recipes"""
     tags = TagSerializer(many=True, required=False)
     ingredients = IngredientSerializer(many=True, required=False)
@@ -34,13 +55,11 @@ class RecipeSerializer(serializers.ModelSerializer):
 
     def _get_or_create_tags(self, tags, recipe):
         """Handle getting or creating tags as needed"""
+        if not tags:
+            return
         auth_user = self.context['request'].user
-        for tag in tags:
-            tag_obj, created = Tag.objects.get_or_create(
-                user=auth_user,
-                **tag,
-            )
-            recipe.tags.add(tag_obj)
+        recipe.tags.add(*Tag.objects.get_or_create_many(
+            auth_user, [tag['name'] for tag in tags]))
 
     def _get_or_create_ingredients(self, ingredients, recipe):
         """Handle getting or creating ingredients as needed"""
@@ -0,0 +1,107 @@
+"""
+Helpers shared by the recipe API tests
+"""
+
+from contextlib import ExitStack
+from decimal import Decimal
+from types import MappingProxyType
+
+from django.contrib.auth import get_user_model
+from django.db import connections
+from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+from core.models import Recipe
+
+
+def detail_url_prefix(name):
+    """Return the recipe API detail URL for name, minus the trailing id
+
+    The route is reversed once with a placeholder id, so detail URLs can
+    be built by appending the real id instead of reversing per call.
+    """
+    return reverse(f'recipe:{name}-detail', args=[0])[:-2]
+
+
+RECIPES_URL = reverse('recipe:recipe-list')
+# read-only so tests cannot leak changes into each other
+TEST_PAYLOAD = MappingProxyType({
+    'title': 'Sample recipe title',
+    'time_minutes': 22,
+    'price': Decimal('5.25'),
+    'description': 'Sample description',
+    'link': 'http//example.com/recipe.pdf',
+})
+
+RECIPE_DETAIL_PREFIX = detail_url_prefix('recipe')
+
+
+def detail_url(recipe_id):
+    """
+    Create and return a recipe detial URL
+    """
+    return f'{RECIPE_DETAIL_PREFIX}{recipe_id}/'
+
+
+def create_recipe(user, **params):
+    """create and return a smaple recipe"""
+    defaults = {**TEST_PAYLOAD, **params}
+    recipe = Recipe.objects.create(user=user, **defaults)
+
+    return recipe
+
+
+def bulk_create_recipes(user, n=2, **params):
+    """create n sample recipes in a single query"""
+    defaults = {**TEST_PAYLOAD, **params}
+    # Recipe() cannot take m2m values; attach tags with recipe.tags.add()
+    defaults.pop('tags', None)
+
+    return Recipe.objects.bulk_create(
+        [Recipe(user=user, **defaults) for _ in range(n)]
+    )
+
+
+def create_user(**params):
+    """create and return a new user"""
+    return get_user_model().objects.create_user(**params)
+
+
+def _block_writes(execute, sql, params, many, context):
+    """Fail on any statement that is not a SELECT"""
+    if not sql.lstrip().upper().startswith('SELECT'):
+        raise AssertionError(f'Write in a read-only test: {sql}')
+    return execute(sql, params, many, context)
+
+
+class PrivateAPITestCase(TestCase):
+    """TestCase for API requests made as cls.user
+
+    Subclasses create cls.user in setUpTestData. Django builds a fresh
+    APIClient for each test, which is authenticated as that user.
+    """
+    client_class = APIClient
+
+    def setUp(self):
+        self.client.force_authenticate(self.user)
+
+
+class ReadOnlyTestCase(PrivateAPITestCase):
+    """TestCase for tests that only read data built in setUpTestData
+
+    The class-wide transaction around setUpTestData already isolates the
+    data, so the per-test savepoint and rollback are skipped. Any query
+    other than a SELECT fails the test instead.
+    """
+
+    def _fixture_setup(self):
+        self._write_guard = ExitStack()
+        for db_name in self._databases_names(include_mirrors=False):
+            self._write_guard.enter_context(
+                connections[db_name].execute_wrapper(_block_writes)
+            )
+
+    def _fixture_teardown(self):
+        self._write_guard.close()
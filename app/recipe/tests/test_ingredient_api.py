@@ -2,21 +2,27 @@
 
 from django.contrib.auth import get_user_model
 from django.urls import reverse
-from django.test import TestCase
+from django.test import SimpleTestCase
 
 from rest_framework.test import APIClient
 from rest_framework import status
 
 from core.models import Ingredient
 
-from recipe.serializers import IngredientSerializer
+from recipe.tests.helpers import (
+    PrivateAPITestCase,
+    ReadOnlyTestCase,
+    detail_url_prefix,
+)
 
 INGREDIENT_URL = reverse('recipe:ingredient-list')
 
+INGREDIENT_DETAIL_PREFIX = detail_url_prefix('ingredient')
+
 
 def detail_url(ingred_id):
     """Ingredient detail url"""
-    return reverse('recipe:ingredient-detail', args=[ingred_id])
+    return f'{INGREDIENT_DETAIL_PREFIX}{ingred_id}/'
 
 
 def create_user(email='user@example.com', password='testpass123'):
@@ -24,7 +30,7 @@ def create_user(email='user@example.com', password='testpass123'):
     return get_user_model().objects.create_user(email=email, password=password)
 
 
-class PublicIngredientsApiTests(TestCase):
+class PublicIngredientsApiTests(SimpleTestCase):
     """test unauthenticated API requests"""
 
     def setUp(self):
@@ -37,39 +43,46 @@ class PublicIngredientsApiTests(TestCase):
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
-class PrivateIngredientsApiTests(TestCase):
-    """test authenticated API requests"""
+class PrivateIngredientsListApiTests(ReadOnlyTestCase):
+    """test listing ingredients as an authenticated user"""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = create_user()
-        self.client.force_authenticate(self.user)
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        cls.other_user = create_user(email="otheruser@example.com")
+        cls.other_ingredient = Ingredient.objects.create(
+            user=cls.other_user, name='Salt')
+        Ingredient.objects.create(user=cls.user, name="kale")
+        Ingredient.objects.create(user=cls.user, name="Vanilla")
 
     def test_retrieve_ingredients(self):
         """Test retrieving a list of ingredients"""
-        Ingredient.objects.create(user=self.user, name="kale")
-        Ingredient.objects.create(user=self.user, name="Vanilla")
-
-        res = self.client.get(INGREDIENT_URL)
+        with self.assertNumQueries(1):
+            res = self.client.get(INGREDIENT_URL)
 
-        ingredients = Ingredient.objects.all().order_by('-name')
-        serializer = IngredientSerializer(ingredients, many=True)
+        ingredients = Ingredient.objects.filter(
+            user=self.user).order_by('-name').values('id', 'name')
 
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(res.data, list(ingredients))
         self.assertEqual(res.status_code, status.HTTP_200_OK)
 
     def test_ingredients_limited_to_user(self):
         """test list of ingredients is limited to authenticated user"""
-        user2 = create_user(email="otheruser@example.com")
-        Ingredient.objects.create(user=user2, name='Salt')
-
-        ingredient = Ingredient.objects.create(user=self.user, name='Curry')
-
         res = self.client.get(INGREDIENT_URL)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(res.data), 1)
-        self.assertEqual(res.data[0]['id'], ingredient.id)
-        self.assertEqual(res.data[0]['name'], ingredient.name)
+        self.assertEqual(len(res.data), 2)
+        self.assertNotIn(
+            self.other_ingredient.id,
+            [ingredient['id'] for ingredient in res.data],
+        )
+
+
+class PrivateIngredientsApiTests(PrivateAPITestCase):
+    """test authenticated API requests"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
 
     def test_update_ingredient(self):
         ingredient = Ingredient.objects.create(name='Mistery', user=self.user)
@@ -0,0 +1,165 @@
+"""
+Tests for creating, updating and deleting recipes
+"""
+
+from decimal import Decimal
+
+from rest_framework import status
+
+from core.models import (
+    Recipe,
+    Ingredient
+)
+
+from recipe.tests.helpers import (
+    RECIPES_URL,
+    PrivateAPITestCase,
+    TEST_PAYLOAD,
+    create_recipe,
+    create_user,
+    detail_url,
+)
+
+
+class PrivateRecipeCRUDAPITests(PrivateAPITestCase):
+    """Test creating, updating and deleting recipes"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
+            email='user@example.com',
+            password='testpass234'
+        )
+        cls.other_user = create_user(
+            email='other@example.com',
+            password='testpass234'
+        )
+
+    def test_create_recipe(self):
+        """Test creating a recipe"""
+        payload = dict(TEST_PAYLOAD)
+
+        res = self.client.post(RECIPES_URL, payload)  # /api/recipes/recipe
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        recipe = Recipe.objects.get(id=res.data['id'])
+        for k, v in payload.items():
+            self.assertEqual(getattr(recipe, k), v)
+        self.assertEqual(recipe.user, self.user)
+
+    def test_partial_update(self):
+        """ Test partial update of a recipe"""
+        original_link = 'https://example.com/recipe.pdf'
+        recipe = create_recipe(
+            user=self.user,
+            title='sample recipe title',
+            link=original_link
+        )
+
+        payload = {'title': 'new recipe title'}
+        url = detail_url(recipe.id)
+        res = self.client.patch(url, payload)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        # django does not update the obj automatically
+        recipe.refresh_from_db()
+        self.assertEqual(recipe.title, payload['title'])
+        self.assertEqual(recipe.link, original_link)
+        self.assertEqual(recipe.user, self.user)
+
+    def test_full_update(self):
+        """Test full update of recipe"""
+        recipe = create_recipe(
+            user=self.user,
+            title='Sample recipe title',
+            time_minutes=25,
+            price=Decimal('5.25'),
+            description='Sample description',
+            link='http//example.com/recipe.pdf',
+        )
+        update_payload = {
+            'title': 'New Sample recipe title',
+            'time_minutes': 30,
+            'price': Decimal('6.25'),
+            'description': 'New Sample description',
+            'link': 'http//example.com/new_recipe.pdf',
+        }
+
+        url = detail_url(recipe.id)
+        res = self.client.put(url, update_payload)
+        recipe.refresh_from_db()
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        for k, v in update_payload.items():
+            self.assertEqual(getattr(recipe, k), v)
+        self.assertEqual(recipe.user, self.user)
+
+    def test_update_user_returns_error(self):
+        """Test changing the recipe user results in an error"""
+        recipe = create_recipe(self.user)
+        payload = {"user": self.other_user.id, }
+        url = detail_url(recipe.id)
+        self.client.patch(url, payload)
+
+        recipe.refresh_from_db()
+        self.assertEqual(recipe.user, self.user)
+
+    def test_delete_recipe(self):
+        """Test deleting recipe"""
+        recipe = create_recipe(user=self.user)
+
+        url = detail_url(recipe.id)
+        res = self.client.delete(url)
+
+        self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Recipe.objects.filter(id=recipe.id).exists())
+
+    def test_delete_recipe_other_users_recipe_error(self):
+        """Test trying to delete other users recipe returns error"""
+        recipe = create_recipe(user=self.other_user)
+
+        url = detail_url(recipe.id)
+        res = self.client.delete(url)
+
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertTrue(Recipe.objects.filter(id=recipe.id).exists())
+
+    def test_create_recipe_with_new_ingredients(self):
+        """Test creating a recipe with new ingredients"""
+        ing_1 = 'Ground beef'
+        ing_2 = 'Bun'
+        payload = {
+            'title': 'Markham Burger',
+            'time_minutes': 15,
+            'price': Decimal('7.50'),
+            'ingredients': [{'name': ing_1}, {'name': ing_2}]
+        }
+
+        res = self.client.post(RECIPES_URL, payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+
+        ingredients = Ingredient.objects.filter(user=self.user)
+        self.assertEqual(ingredients.count(), 2)
+        self.assertTrue(ingredients.filter(name=ing_1).exists())
+        self.assertTrue(ingredients.filter(name=ing_2).exists())
+
+    def test_create_recipe_with_existing_ingredient(self):
+        """Test creating recipe with existing ingredient"""
+        ingredient = Ingredient.objects.create(name='Onion', user=self.user)
+
+        payload = {
+            'title': 'Markham Burger',
+            'time_minutes': 15,
+            'price': Decimal('7.50'),
+            'ingredients': [{'name': ingredient.name}]
+        }
+        res = self.client.post(RECIPES_URL, payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+
+        recipes = Recipe.objects.filter(
+            title=payload['title'])
+        recipe = recipes[0]
+
+        self.assertEqual(recipe.ingredients.count(), 1)
+        self.assertTrue(recipe.ingredients.filter(id=ingredient.id).exists())
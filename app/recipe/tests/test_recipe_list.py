@@ -0,0 +1,82 @@
+"""
+Tests for listing and retrieving recipes
+"""
+
+from django.test import SimpleTestCase
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Recipe
+
+from recipe.serializers import (
+    RecipeSerializer,
+    RecipeDetailSerializer,
+)
+from recipe.tests.helpers import (
+    RECIPES_URL,
+    ReadOnlyTestCase,
+    bulk_create_recipes,
+    create_recipe,
+    create_user,
+    detail_url,
+)
+
+
+class PublicRecipeAPITests(SimpleTestCase):
+    """Test unauthenticated API requests"""
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_auth_requried(self):
+        """Test auth is required to the API"""
+        res = self.client.get(RECIPES_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class PrivateRecipeListAPITests(ReadOnlyTestCase):
+    """Test listing and retrieving recipes"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
+            email='user@example.com',
+            password='testpass234'
+        )
+        cls.other_user = create_user(
+            email='other@example.com',
+            password='testpass234'
+        )
+        cls.recipe = create_recipe(user=cls.user)
+        bulk_create_recipes(user=cls.user)
+        bulk_create_recipes(user=cls.other_user, n=1)
+
+    def test_retrieve_recipes(self):
+        """Test retrieving a list of recipes"""
+        # recipes, then one prefetch query each for tags and ingredients
+        with self.assertNumQueries(3):
+            res = self.client.get(RECIPES_URL)
+
+        recipe_ids = Recipe.objects.filter(
+            user=self.user).order_by('-id').values_list('id', flat=True)
+        self.assertEqual([r['id'] for r in res.data], list(recipe_ids))
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_recipe_list_limited_to_user(self):
+        """Test list of recipes is limited to authenticated user"""
+        res = self.client.get(RECIPES_URL)
+
+        recipes = Recipe.objects.filter(user=self.user).order_by('-id')
+        serializer = RecipeSerializer(recipes, many=True)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data, serializer.data)
+
+    def test_get_recipe_detail(self):
+        """Test get recipe detail"""
+        url = detail_url(self.recipe.id)
+        res = self.client.get(url)
+
+        serializer = RecipeDetailSerializer(self.recipe)
+        self.assertEqual(res.data, serializer.data)
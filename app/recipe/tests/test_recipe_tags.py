@@ -0,0 +1,140 @@
+"""
+Tests for recipe tag handling
+"""
+
+from decimal import Decimal
+
+from rest_framework import status
+
+from core.models import (
+    Recipe,
+    Tag,
+)
+
+from recipe.tests.helpers import (
+    RECIPES_URL,
+    PrivateAPITestCase,
+    TEST_PAYLOAD,
+    create_recipe,
+    create_user,
+    detail_url,
+)
+
+
+class PrivateRecipeTagsAPITests(PrivateAPITestCase):
+    """Test creating and updating recipe tags"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
+            email='user@example.com',
+            password='testpass234'
+        )
+
+    def test_create_recipe_with_new_tag(self):
+        """Test creating a recipe with new tags"""
+        payload = {
+            'title': 'Thai Prawn Curry',
+            'time_minutes': 30,
+            'price': Decimal('2.50'),
+            'tags': [{'name': 'Thai'}, {'name': 'Dinner'}]
+        }
+
+        res = self.client.post(RECIPES_URL, payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        recipes = Recipe.objects.filter(user=self.user)
+        self.assertEqual(recipes.count(), 1)
+        recipe = recipes[0]
+        self.assertEqual(recipe.tags.count(), 2)
+        for tag in payload['tags']:
+            exist = Tag.objects.filter(
+                user=self.user,
+                name=tag['name']
+            ).exists()
+            self.assertTrue(exist)
+
+    def test_create_recipe_with_existing_tags(self):
+        tag_chn = Tag.objects.create(user=self.user, name='Chinese')
+        payload = {
+            **TEST_PAYLOAD,
+            'tags': [{'name': tag_chn.name}, {'name': 'Japanese'}],
+        }
+        res = self.client.post(RECIPES_URL, payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        recipes = Recipe.objects.filter(user=self.user)
+        self.assertEqual(recipes.count(), 1)
+        recipe = recipes[0]
+        self.assertEqual(recipe.tags.count(), 2)
+        self.assertIn(tag_chn, recipe.tags.all())
+        for tag in payload['tags']:
+            exist = Tag.objects.filter(
+                user=self.user,
+                name=tag['name']
+            ).exists()
+            self.assertTrue(exist)
+
+    def test_create_recipe_with_repeated_tag(self):
+        """Test a tag repeated in the payload is only created once"""
+        payload = {
+            **TEST_PAYLOAD,
+            'tags': [{'name': 'Thai'}, {'name': 'Thai'}],
+        }
+        res = self.client.post(RECIPES_URL, payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        recipe = Recipe.objects.get(id=res.data['id'])
+        self.assertEqual(recipe.tags.count(), 1)
+        self.assertEqual(
+            Tag.objects.filter(user=self.user, name='Thai').count(), 1)
+
+    def test_create_tag_on_update(self):
+        """test creating tag when updating recipe"""
+        recipe = create_recipe(self.user)
+        payload = {
+            'tags': [
+                {'name': 'Lunch'}
+            ]
+        }
+        url = detail_url(recipe.id)
+        res = self.client.patch(url, payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        new_tag = Tag.objects.get(user=self.user, name='Lunch')
+        self.assertIn(new_tag, recipe.tags.all())
+
+    def test_update_recipe_assign_tag(self):
+        """Test assigning an existing tag when updating a recipe"""
+        tag = Tag.objects.create(name='breakfast', user=self.user)
+        recipe = create_recipe(self.user)
+        recipe.tags.add(tag)
+        tag_new = Tag.objects.create(name='dinner', user=self.user)
+        payload = {
+            'tags': [{'name': 'dinner'}]
+        }
+        url = detail_url(recipe.id)
+        res = self.client.patch(url, payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        recipe.refresh_from_db()
+        self.assertIn(tag_new, recipe.tags.all())
+        self.assertNotIn(tag, recipe.tags.all())
+
+    def test_clear_recipe_tags(self):
+        """test clearing recipe tags"""
+
+        tag = Tag.objects.create(name='breakfast', user=self.user)
+        recipe = create_recipe(self.user)
+        recipe.tags.add(tag)
+
+        payload = {
+            'tags': []
+        }
+
+        url = detail_url(recipe.id)
+        res = self.client.patch(url, payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        recipe.refresh_from_db()
+        self.assertEqual(recipe.tags.count(), 0)
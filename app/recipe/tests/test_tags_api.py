@@ -2,20 +2,27 @@
 
 from django.contrib.auth import get_user_model
 from django.urls import reverse
-from django.test import TestCase
+from django.test import SimpleTestCase
 
 from rest_framework.test import APIClient
 from rest_framework import status
-from recipe.serializers import TagSerializer
 
 from core.models import Tag
 
+from recipe.tests.helpers import (
+    PrivateAPITestCase,
+    ReadOnlyTestCase,
+    detail_url_prefix,
+)
+
 TAGS_URL = reverse('recipe:tag-list')
 
+TAG_DETAIL_PREFIX = detail_url_prefix('tag')
+
 
 def detail_url(tag_id):
     """create and return a tag detail url"""
-    return reverse('recipe:tag-detail', args=[tag_id])
+    return f'{TAG_DETAIL_PREFIX}{tag_id}/'
 
 
 def create_user(email='user@example.com', password='testpass123'):
@@ -23,7 +30,7 @@ def create_user(email='user@example.com', password='testpass123'):
     return get_user_model().objects.create_user(email=email, password=password)
 
 
-class PublicTagsAPITest(TestCase):
+class PublicTagsAPITest(SimpleTestCase):
     """Test unauthenticated API requests"""
 
     def setUp(self):
@@ -34,38 +41,46 @@ class PublicTagsAPITest(TestCase):
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
-class PrivateTagsAPITest(TestCase):
-    """Test authenticated API requests"""
+class PrivateTagsListAPITest(ReadOnlyTestCase):
+    """Test listing tags as an authenticated user"""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = create_user()
-        self.client.force_authenticate(self.user)
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        cls.other_user = create_user(
+            email='user2@example.com', password='test123')
+        cls.other_tag = Tag.objects.create(
+            user=cls.other_user, name='user2 tag')
+        Tag.objects.create(user=cls.user, name='tag1')
+        Tag.objects.create(user=cls.user, name='tag2')
 
     def test_retrieve_tags(self):
         """Test retrieving a list of tags"""
-        Tag.objects.create(user=self.user, name='tag1')
-        Tag.objects.create(user=self.user, name='tag2')
-
-        res = self.client.get(TAGS_URL)
+        with self.assertNumQueries(1):
+            res = self.client.get(TAGS_URL)
 
-        tags = Tag.objects.all().order_by('-name')
-        serializer = TagSerializer(tags, many=True)
+        tags = Tag.objects.filter(
+            user=self.user).order_by('-name').values('id', 'name')
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(res.data, list(tags))
 
     def test_tags_limited_to_user(self):
         """Test list of tags is limited to authenticated user"""
-        user2 = create_user(email='user2@example.com', password='test123')
-        Tag.objects.create(user=user2, name='user2 tag')
-        tag = Tag.objects.create(user=self.user, name='user tag')
-
         res = self.client.get(TAGS_URL)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(res.data), 1)
-        self.assertEqual(res.data[0]['name'], tag.name)
-        self.assertEqual(res.data[0]['id'], tag.id)
+        self.assertEqual(len(res.data), 2)
+        self.assertNotIn(self.other_tag.id, [tag['id'] for tag in res.data])
+
+
+class PrivateTagsAPITest(PrivateAPITestCase):
+    """Test authenticated API requests"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        cls.other_user = create_user(
+            email='user2@example.com', password='test123')
 
     def test_update_tag(self):
         """ Test updating a tag"""
@@ -89,8 +104,7 @@ class PrivateTagsAPITest(TestCase):
 
     def test_delete_other_user_tag_fail(self):
         """Test deleting other user's tag should fail"""
-        user_new = create_user(email='user_new@example.com')
-        tag = Tag.objects.create(user=user_new, name="New user's tag")
+        tag = Tag.objects.create(user=self.other_user, name="New user's tag")
         url = detail_url(tag.id)
         res = self.client.delete(url)
 
@@ -1,355 +0,0 @@
-"""
-Tests for recipe api
-"""
-
-
-from decimal import Decimal
-
-from django.contrib.auth import get_user_model
-from django.test import TestCase
-from django.urls import reverse
-
-from rest_framework import status
-from rest_framework.test import APIClient
-
-from core.models import (
-    Recipe,
-    Tag,
-    Ingredient
-)
-
-from recipe.serializers import (
-    RecipeSerializer,
-    RecipeDetailSerializer,
-)
-
-RECIPES_URL = reverse('recipe:recipe-list')
-TEST_PAYLOAD = {
-    'title': 'Sample recipe title',
-    'time_minutes': 22,
-    'price': Decimal('5.25'),
-    'description': 'Sample description',
-    'link': 'http//example.com/recipe.pdf',
-}
-
-
-def detail_url(recipe_id):
-    """
-    Create and return a recipe detial URL
-    """
-    return reverse('recipe:recipe-detail', args=[recipe_id])
-
-
-def create_recipe(user, **params):
-    """create and return a smaple recipe"""
-    defaults = TEST_PAYLOAD.copy()
-    defaults.update(params)
-
-    # Extract the tags from the defaults, if provided
-    tags = defaults.pop('tags', [])
-
-    # Create the recipe without setting tags yet
-    recipe = Recipe.objects.create(user=user, **defaults)
-
-    if tags:
-        tag_objects = []
-        for tag_data in tags:
-            tag, created = Tag.objects.get_or_create(user=user, **tag_data)
-            tag_objects.append(tag)
-
-        recipe.tags.set(tag_objects)
-
-    return recipe
-
-
-def create_user(**params):
-    """create and return a new user"""
-    return get_user_model().objects.create_user(**params)
-
-
-class PublicRecipeAPITests(TestCase):
-    """Test unauthenticated API requests"""
-
-    def setUp(self):
-        self.client = APIClient()
-
-    def test_auth_requried(self):
-        """Test auth is required to the API"""
-        res = self.client.get(RECIPES_URL)
-
-        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
-
-
-class PrivateRecipeAPITests(TestCase):
-    """Test authenticated API requests"""
-
-    def setUp(self):
-        self.client = APIClient()
-        self.user = create_user(
-            email='user@example.com',
-            password='testpass234'
-        )
-        self.client.force_authenticate(self.user)
-
-    def test_retrieve_recipes(self):
-        """Test retrieving a list of recipes"""
-        create_recipe(user=self.user)
-        create_recipe(user=self.user)
-
-        res = self.client.get(RECIPES_URL)
-
-        recipes = Recipe.objects.all().order_by('-id')
-        serializer = RecipeSerializer(recipes, many=True)
-        self.assertEqual(res.data, serializer.data)
-        self.assertEqual(res.status_code, status.HTTP_200_OK)
-
-    def test_recipe_list_limited_to_user(self):
-        """Test list of recipes is limited to authenticated user"""
-        other_user = create_user(
-            email='other@example.com',
-            password='testpass234'
-        )
-
-        create_recipe(user=other_user)
-        create_recipe(user=self.user)
-
-        res = self.client.get(RECIPES_URL)
-
-        recipes = Recipe.objects.filter(user=self.user)
-        serializer = RecipeSerializer(recipes, many=True)
-        self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
-
-    def test_get_recipe_detail(self):
-        """Test get recipe detail"""
-        recipe = create_recipe(user=self.user)
-
-        url = detail_url(recipe.id)
-        res = self.client.get(url)
-
-        serializer = RecipeDetailSerializer(recipe)
-        self.assertEqual(res.data, serializer.data)
-
-    def test_create_recipe(self):
-        """Test creating a recipe"""
-        payload = TEST_PAYLOAD
-
-        res = self.client.post(RECIPES_URL, payload)  # /api/recipes/recipe
-
-        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
-        recipe = Recipe.objects.get(id=res.data['id'])
-        for k, v in payload.items():
-            self.assertEqual(getattr(recipe, k), v)
-        self.assertEqual(recipe.user, self.user)
-
-    def test_partial_update(self):
-        """ Test partial update of a recipe"""
-        original_link = 'https://example.com/recipe.pdf'
-        recipe = create_recipe(
-            user=self.user,
-            title='sample recipe title',
-            link=original_link
-        )
-
-        payload = {'title': 'new recipe title'}
-        url = detail_url(recipe.id)
-        res = self.client.patch(url, payload)
-
-        self.assertEqual(res.status_code, status.HTTP_200_OK)
-        # django does not update the obj automatically
-        recipe.refresh_from_db()
-        self.assertEqual(recipe.title, payload['title'])
-        self.assertEqual(recipe.link, original_link)
-        self.assertEqual(recipe.user, self.user)
-
-    def test_full_update(self):
-        """Test full update of recipe"""
-        recipe = create_recipe(
-            user=self.user,
-            title='Sample recipe title',
-            time_minutes=25,
-            price=Decimal('5.25'),
-            description='Sample description',
-            link='http//example.com/recipe.pdf',
-        )
-        update_payload = {
-            'title': 'New Sample recipe title',
-            'time_minutes': 30,
-            'price': Decimal('6.25'),
-            'description': 'New Sample description',
-            'link': 'http//example.com/new_recipe.pdf',
-        }
-
-        url = detail_url(recipe.id)
-        res = self.client.put(url, update_payload)
-        recipe.refresh_from_db()
-        self.assertEqual(res.status_code, status.HTTP_200_OK)
-        for k, v in update_payload.items():
-            self.assertEqual(getattr(recipe, k), v)
-        self.assertEqual(recipe.user, self.user)
-
-    def test_update_user_returns_error(self):
-        """Test changing the recipe user results in an error"""
-        new_user = create_user(
-            email='newuser@example.com', password="newpass123")
-        recipe = create_recipe(self.user)
-        payload = {"user": new_user.id, }
-        url = detail_url(recipe.id)
-        self.client.patch(url, payload)
-
-        recipe.refresh_from_db()
-        self.assertEqual(recipe.user, self.user)
-
-    def test_delete_recipe(self):
-        """Test deleting recipe"""
-        recipe = create_recipe(user=self.user)
-
-        url = detail_url(recipe.id)
-        res = self.client.delete(url)
-
-        self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
-        self.assertFalse(Recipe.objects.filter(id=recipe.id).exists())
-
-    def test_delete_recipe_other_users_recipe_error(self):
-        """Test trying to delete other users recipe returns error"""
-        new_user = create_user(email='user2@example.com', password="test555")
-        recipe = create_recipe(user=new_user)
-
-        url = detail_url(recipe.id)
-        res = self.client.delete(url)
-
-        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
-        self.assertTrue(Recipe.objects.filter(id=recipe.id).exists())
-
-    def test_create_recipe_with_new_tag(self):
-        """Test creating a recipe with new tags"""
-        payload = {
-            'title': 'Thai Prawn Curry',
-            'time_minutes': 30,
-            'price': Decimal('2.50'),
-            'tags': [{'name': 'Thai'}, {'name': 'Dinner'}]
-        }
-
-        res = self.client.post(RECIPES_URL, payload, format='json')
-
-        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
-        recipes = Recipe.objects.filter(user=self.user)
-        self.assertEqual(recipes.count(), 1)
-        recipe = recipes[0]
-        self.assertEqual(recipe.tags.count(), 2)
-        for tag in payload['tags']:
-            exist = Tag.objects.filter(
-                user=self.user,
-                name=tag['name']
-            ).exists()
-            self.assertTrue(exist)
-
-    def test_create_recipe_with_existing_tags(self):
-        tag_chn = Tag.objects.create(user=self.user, name='Chinese')
-        payload = TEST_PAYLOAD
-        payload['tags'] = [{'name': tag_chn.name}, {'name': 'Japanese'}]
-        res = self.client.post(RECIPES_URL, payload, format='json')
-
-        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
-        recipes = Recipe.objects.filter(user=self.user)
-        self.assertEqual(recipes.count(), 1)
-        recipe = recipes[0]
-        self.assertEqual(recipe.tags.count(), 2)
-        self.assertIn(tag_chn, recipe.tags.all())
-        for tag in payload['tags']:
-            exist = Tag.objects.filter(
-                user=self.user,
-                name=tag['name']
-            ).exists()
-            self.assertTrue(exist)
-
-    def test_create_tag_on_update(self):
-        """test creating tag when updating recipe"""
-        recipe = create_recipe(self.user)
-        payload = {
-            'tags': [
-                {'name': 'Lunch'}
-            ]
-        }
-        url = detail_url(recipe.id)
-        res = self.client.patch(url, payload, format='json')
-
-        self.assertEqual(res.status_code, status.HTTP_200_OK)
-        new_tag = Tag.objects.get(user=self.user, name='Lunch')
-        self.assertIn(new_tag, recipe.tags.all())
-
-    def test_update_recipe_assign_tag(self):
-        """Test assigning an existing tag when updating a recipe"""
-        tag = Tag.objects.create(name='breakfast', user=self.user)
-        recipe = create_recipe(self.user)
-        recipe.tags.add(tag)
-        tag_new = Tag.objects.create(name='dinner', user=self.user)
-        payload = {
-            'tags': [{'name': 'dinner'}]
-        }
-        url = detail_url(recipe.id)
-        res = self.client.patch(url, payload, format='json')
-
-        self.assertEqual(res.status_code, status.HTTP_200_OK)
-        recipe.refresh_from_db()
-        self.assertIn(tag_new, recipe.tags.all())
-        self.assertNotIn(tag, recipe.tags.all())
-
-    def test_clear_recipe_tags(self):
-        """test clearing recipe tags"""
-
-        tag = Tag.objects.create(name='breakfast', user=self.user)
-        recipe = create_recipe(self.user)
-        recipe.tags.add(tag)
-
-        payload = {
-            'tags': []
-        }
-
-        url = detail_url(recipe.id)
-        res = self.client.patch(url, payload, format='json')
-
-        self.assertEqual(res.status_code, status.HTTP_200_OK)
-        recipe.refresh_from_db()
-        self.assertEqual(recipe.tags.count(), 0)
-
-    def test_create_recipe_with_new_ingredients(self):
-        """Test creating a recipe with new ingredients"""
-        ing_1 = 'Ground beef'
-        ing_2 = 'Bun'
-        payload = {
-            'title': 'Markham Burger',
-            'time_minutes': 15,
-            'price': Decimal('7.50'),
-            'ingredients': [{'name': ing_1}, {'name': ing_2}]
-        }
-
-        res = self.client.post(RECIPES_URL, payload, format='json')
-
-        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
-
-        ingredients = Ingredient.objects.filter(user=self.user)
-        self.assertEqual(ingredients.count(), 2)
-        self.assertTrue(ingredients.filter(name=ing_1).exists())
-        self.assertTrue(ingredients.filter(name=ing_2).exists())
-
-    def test_create_recipe_with_existing_ingredient(self):
-        """Test creating recipe with existing ingredient"""
-        ingredient = Ingredient.objects.create(name='Onion', user=self.user)
-
-        payload = {
-            'title': 'Markham Burger',
-            'time_minutes': 15,
-            'price': Decimal('7.50'),
-            'ingredients': [{'name': ingredient.name}]
-        }
-        res = self.client.post(RECIPES_URL, payload, format='json')
-
-        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
-
-        recipes = Recipe.objects.filter(
-            title=payload['title'])
-        recipe = recipes[0]
-
-        self.assertEqual(recipe.ingredients.count(), 1)
-        self.assertTrue(recipe.ingredients.filter(id=ingredient.id).exists())
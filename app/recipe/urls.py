@@ -3,11 +3,11 @@ URL mappings for the recipe API
 """
 
 from django.urls import path, include
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 
 from recipe import views
 
-router = DefaultRouter()
+router = SimpleRouter()
 router.register(prefix='recipes', viewset=views.RecipeViewSet)
 router.register(prefix='tags', viewset=views.TagViewSet)
 router.register(prefix='ingredients', viewset=views.IngredientViewSet)
@@ -27,7 +27,12 @@ class RecipeViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """retrieve recipes for authenticated users"""
-        return self.queryset.filter(user=self.request.user).order_by('-id')
+        queryset = self.queryset.filter(user=self.request.user).order_by('-id')
+        if self.action in ('list', 'retrieve'):
+            # only these actions serialize the stored tags and ingredients
+            queryset = queryset.prefetch_related('tags', 'ingredients')
+
+        return queryset
 
     def get_serializer_class(self):
         """Return the serializer class for request"""